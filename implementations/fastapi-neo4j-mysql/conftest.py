@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+Scratch FastAPI projects for exercising the methodology CLI
+"""
+
+from typing import Callable
+from pathlib import Path
+import pytest
+
+from methodology import cache
+
+RDS = '''# Requirements Document Specification (RDS)
+
+**Version**: 1.2.0  
+**Project**: Orders Service  
+'''
+
+ROUTER = '''from fastapi import APIRouter
+
+router = APIRouter(prefix="/items{index}", tags=["items"])
+
+@router.get("/")
+async def list_items():
+    return []
+'''
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """An empty project directory with docs/RDS.md, used as the working directory"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('METHODOLOGY_CACHE_DIR', '')
+    monkeypatch.setattr(cache, '_memory', {})
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs/RDS.md').write_text(RDS, encoding='utf-8')
+    return tmp_path
+
+@pytest.fixture
+def write_app(project: Path) -> Callable[[int], None]:
+    """Write small router modules app/api/items<N>.py into the project"""
+    def write(count: int):
+        package = project / 'app/api'
+        package.mkdir(parents=True, exist_ok=True)
+        for index in range(count):
+            source = ROUTER.replace('{index}', str(index))
+            (package / f'items{index}.py').write_text(source, encoding='utf-8')
+    return write
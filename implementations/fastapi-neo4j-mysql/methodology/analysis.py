@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Implementation Analysis
+Builds a cached AST index of a FastAPI project's app/ tree
+"""
+
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path('.methodology/implementation-index.json')
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Bump when the per-file summary format changes to invalidate cached entries
+ANALYZER_VERSION = 2
+
+HTTP_METHODS = {'get', 'post', 'put', 'patch', 'delete', 'options', 'head', 'trace', 'api_route', 'websocket'}
+PYDANTIC_MODULES = ('pydantic', 'pydantic_settings')
+
+CYPHER_CLAUSE = re.compile(r'^\s*(OPTIONAL\s+MATCH|MATCH|MERGE|CREATE|UNWIND|CALL|WITH|RETURN)\b')
+CYPHER_PATTERN = re.compile(r'\(\s*\w*\s*:\s*[A-Za-z_`]|-\[|\]->|<-\[')
+
+def find_artifacts(root: Path = Path('app')) -> List[str]:
+    """Python source files under the application package"""
+    return sorted(path.as_posix() for path in root.rglob('*.py'))
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except Exception:
+        # Not a literal (names, calls) or unhashable/too deep to evaluate
+        return ast.unparse(node)
+
+def _methods(node: Optional[ast.AST]) -> List[str]:
+    """HTTP methods of an api_route decorator; non-literal values are kept as one item"""
+    if node is None:
+        return ['GET']
+    value = _literal(node)
+    if isinstance(value, (list, tuple)) and value and all(isinstance(item, str) for item in value):
+        return [item.upper() for item in value]
+    return [ast.unparse(node)]
+
+def _keyword(call: ast.Call, name: str) -> Optional[ast.AST]:
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+def _is_annotated(function: ast.AST) -> bool:
+    args = function.args
+    params = args.posonlyargs + args.args + args.kwonlyargs
+    if params and params[0].arg in ('self', 'cls'):
+        params = params[1:]
+    params += [arg for arg in (args.vararg, args.kwarg) if arg is not None]
+    return function.returns is not None and all(param.annotation is not None for param in params)
+
+class _ModuleVisitor(ast.NodeVisitor):
+    """Collects FastAPI, Pydantic, SQLAlchemy and Cypher facts from one module"""
+
+    def __init__(self):
+        self.imports: Dict[str, str] = {}
+        self.routers: List[Dict[str, Any]] = []
+        self.mounts: List[Dict[str, Any]] = []
+        self.endpoints: List[Dict[str, Any]] = []
+        self.classes: List[Dict[str, Any]] = []
+        self.cypher: List[Dict[str, Any]] = []
+        self.functions = 0
+        self.async_functions = 0
+        self.annotated_functions = 0
+        self._scope: List[str] = []
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports[alias.asname or alias.name.split('.')[0]] = alias.name
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        module = node.module or ''
+        for alias in node.names:
+            self.imports[alias.asname or alias.name] = f'{module}.{alias.name}' if module else alias.name
+
+    def _qualify(self, node: ast.AST) -> str:
+        name = ast.unparse(node)
+        head, _, rest = name.partition('.')
+        if head in self.imports:
+            return self.imports[head] + (f'.{rest}' if rest else '')
+        return name
+
+    def _record_router(self, targets: List[ast.AST], value: Optional[ast.AST]):
+        if not isinstance(value, ast.Call):
+            return
+        constructor = self._qualify(value.func).rsplit('.', 1)[-1]
+        if constructor not in ('APIRouter', 'FastAPI'):
+            return
+        for target in targets:
+            if isinstance(target, ast.Name):
+                self.routers.append({
+                    'name': target.id,
+                    'kind': constructor,
+                    'prefix': _literal(_keyword(value, 'prefix')) or '',
+                    'tags': _literal(_keyword(value, 'tags')) or []
+                })
+
+    def visit_Assign(self, node: ast.Assign):
+        self._record_router(node.targets, node.value)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        self._record_router([node.target], node.value)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        if isinstance(node.func, ast.Attribute) and node.func.attr == 'include_router' and node.args:
+            self.mounts.append({
+                'parent': ast.unparse(node.func.value),
+                'router': ast.unparse(node.args[0]),
+                'prefix': _literal(_keyword(node, 'prefix')) or ''
+            })
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant):
+        if isinstance(node.value, str) and CYPHER_CLAUSE.match(node.value) and CYPHER_PATTERN.search(node.value):
+            query = ' '.join(node.value.split())
+            self.cypher.append({
+                'function': '.'.join(self._scope) or '<module>',
+                'line': node.lineno,
+                'query': query
+            })
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        fields = []
+        table = None
+        abstract = False
+        for statement in node.body:
+            if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                fields.append(statement.target.id)
+            elif isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+                    if target.id == '__tablename__':
+                        table = _literal(statement.value)
+                    elif target.id == '__abstract__':
+                        abstract = _literal(statement.value) is True
+                    elif isinstance(statement.value, ast.Call) and \
+                            ast.unparse(statement.value.func).rsplit('.', 1)[-1] in ('Column', 'mapped_column'):
+                        fields.append(target.id)
+
+        self.classes.append({
+            'name': node.name,
+            'line': node.lineno,
+            'bases': [self._qualify(base) for base in node.bases],
+            'fields': fields,
+            'table': table,
+            'abstract': abstract
+        })
+
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def _visit_function(self, node: ast.AST, is_async: bool):
+        self.functions += 1
+        self.async_functions += is_async
+        self.annotated_functions += _is_annotated(node)
+
+        for decorator in node.decorator_list:
+            if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+                continue
+            method = decorator.func.attr
+            if method not in HTTP_METHODS:
+                continue
+            path_node = decorator.args[0] if decorator.args else _keyword(decorator, 'path')
+            methods = _methods(_keyword(decorator, 'methods')) if method == 'api_route' else [method.upper()]
+            self.endpoints.append({
+                'router': ast.unparse(decorator.func.value),
+                'methods': methods,
+                'path': _literal(path_node) or '',
+                'handler': node.name,
+                'async': is_async,
+                'responseModel': ast.unparse(_keyword(decorator, 'response_model')) if _keyword(decorator, 'response_model') else None,
+                'line': node.lineno
+            })
+
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._visit_function(node, False)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self._visit_function(node, True)
+
+def analyze_source(path: str, source: bytes) -> Dict[str, Any]:
+    """Summarize one module; the result is JSON-serializable"""
+    try:
+        tree = ast.parse(source, filename=path)
+    except (SyntaxError, ValueError) as e:
+        return {'syntaxError': f'{type(e).__name__}: {e}'}
+
+    visitor = _ModuleVisitor()
+    visitor.visit(tree)
+    return {
+        'routers': visitor.routers,
+        'mounts': visitor.mounts,
+        'endpoints': visitor.endpoints,
+        'classes': visitor.classes,
+        'cypher': visitor.cypher,
+        'functions': visitor.functions,
+        'asyncFunctions': visitor.async_functions,
+        'annotatedFunctions': visitor.annotated_functions
+    }
+
+def scan_file(item: Tuple[str, Optional[str]]) -> Tuple[str, Optional[str], Optional[Dict[str, Any]]]:
+    """Hash one file and parse it unless its content matches the cached hash
+
+    Returns (path, digest, summary); digest is None if the file vanished and
+    summary is None if the content is unchanged. Runs in pool workers.
+    """
+    artifact, cached_digest = item
+    try:
+        source = Path(artifact).read_bytes()
+    except FileNotFoundError:
+        return artifact, None, None
+    digest = hashlib.sha256(source).hexdigest()
+    if digest == cached_digest:
+        return artifact, digest, None
+    return artifact, digest, analyze_source(artifact, source)
+
+class ImplementationIndex:
+    """Per-file AST summaries persisted in .methodology/implementation-index.json
+
+    Entries are keyed by path and validated by mtime and size first, then by
+    content hash, so only files that actually changed are parsed again.
+    """
+
+    def __init__(self, path: Path = INDEX_PATH, jobs: int = 1):
+        self.path = path
+        self.jobs = jobs
+        self.files: Dict[str, Dict[str, Any]] = self._load()
+        self.stats = {'parsed': 0, 'reused': 0, 'removed': 0}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable implementation index {self.path}: {e}')
+            return {}
+
+        if not isinstance(data, dict) or data.get('analyzerVersion') != ANALYZER_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def refresh(self, artifacts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Bring the index up to date with the given files and return their summaries"""
+        wanted = sorted({artifact for artifact in artifacts if artifact.endswith('.py')})
+
+        for stale in set(self.files) - set(wanted):
+            del self.files[stale]
+            self.stats['removed'] += 1
+            self._dirty = True
+
+        pending = []
+        stats = {}
+        for artifact in wanted:
+            try:
+                stat = os.stat(artifact)
+            except FileNotFoundError:
+                if self.files.pop(artifact, None) is not None:
+                    self.stats['removed'] += 1
+                    self._dirty = True
+                continue
+
+            entry = self.files.get(artifact)
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                self.stats['reused'] += 1
+                continue
+            pending.append((artifact, entry['sha256'] if entry else None))
+            stats[artifact] = stat
+
+        for artifact, digest, summary in self._scan(pending):
+            if digest is None:
+                if self.files.pop(artifact, None) is not None:
+                    self.stats['removed'] += 1
+                self._dirty = True
+                continue
+            if summary is None:
+                entry = self.files[artifact]
+                self.stats['reused'] += 1
+            else:
+                entry = {'sha256': digest, 'summary': summary}
+                self.stats['parsed'] += 1
+            entry.update(mtime=stats[artifact].st_mtime_ns, size=stats[artifact].st_size)
+            self.files[artifact] = entry
+            self._dirty = True
+
+        if self._dirty:
+            self.save()
+        return {artifact: self.files[artifact]['summary'] for artifact in wanted if artifact in self.files}
+
+    def _scan(self, pending: List[Tuple[str, Optional[str]]]) -> Iterator[Tuple[str, Optional[str], Optional[Dict[str, Any]]]]:
+        """Hash and parse candidate files, sharded across processes for large batches
+
+        Results are keyed by path and rendered in sorted order, so the merged
+        index is identical whatever the worker count.
+        """
+        if self.jobs <= 1 or len(pending) < PARALLEL_THRESHOLD:
+            return map(scan_file, pending)
+
+        workers = min(self.jobs, len(pending))
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(scan_file, pending, chunksize=chunksize))
+
+    def digest(self) -> str:
+        """Combined hash of every indexed file, usable as a single build input"""
+        combined = hashlib.sha256()
+        for artifact in sorted(self.files):
+            combined.update(f'{artifact}\0{self.files[artifact]["sha256"]}\n'.encode('utf-8'))
+        return combined.hexdigest()
+
+    def save(self):
+        """Atomically write the index"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'analyzerVersion': ANALYZER_VERSION, 'files': self.files}
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data, separators=(',', ':'), sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self._dirty = False
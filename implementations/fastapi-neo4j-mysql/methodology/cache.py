@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Section Render Cache
+Memoizes expensive generated sections, such as the implementation analysis, in memory and on disk
+"""
+
+from typing import Dict, Any, Callable, List, Optional
+from pathlib import Path
+from types import CodeType
+import hashlib
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Disk entries are keyed by input digests, so every change to the analysed
+# tree leaves an orphan behind; keep the directory bounded
+MAX_ENTRIES = 256
+MAX_AGE = 30 * 24 * 60 * 60
+
+def default_cache_dir() -> Optional[Path]:
+    """Shared on-disk cache location; METHODOLOGY_CACHE_DIR='' disables it"""
+    configured = os.environ.get('METHODOLOGY_CACHE_DIR')
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    base = Path(os.environ.get('XDG_CACHE_HOME', '~/.cache')).expanduser()
+    return base / 'architect-crew-methodology' / 'sections'
+
+# Sections rendered in this process, shared by every adapter instance so
+# batch runs over many projects reuse them without touching the disk
+_memory: Dict[str, Dict[str, Any]] = {}
+_code_digests: Dict[CodeType, str] = {}
+
+def _code_digest(code: CodeType) -> str:
+    """Hash a generator's bytecode and constants, ignoring file paths and line numbers
+
+    Editing a section's text changes its key even without a version bump,
+    while copies of the package in different projects still share entries.
+    """
+    if code not in _code_digests:
+        digest = hashlib.sha256(code.co_code)
+        digest.update(repr(code.co_names).encode('utf-8'))
+        for const in code.co_consts:
+            digest.update(_const_repr(const).encode('utf-8'))
+        _code_digests[code] = digest.hexdigest()
+    return _code_digests[code]
+
+def _const_repr(const: Any) -> str:
+    # frozenset ordering depends on hash randomization, so sort its members
+    if isinstance(const, CodeType):
+        return _code_digest(const)
+    if isinstance(const, frozenset):
+        return 'frozenset(' + ','.join(sorted(_const_repr(item) for item in const)) + ')'
+    if isinstance(const, tuple):
+        return '(' + ','.join(_const_repr(item) for item in const) + ')'
+    return repr(const)
+
+class SectionCache:
+    """Two-level cache for generated sections keyed by adapter, section and inputs
+
+    Only use it for sections that take longer to build than a lookup;
+    returning a literal is faster than hashing its generator.
+    """
+
+    def __init__(self, namespace: str, directory: Optional[Path] = None):
+        self.namespace = namespace
+        self.directory = directory if directory is not None else default_cache_dir()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def _key(self, section: str, build: Callable[[], str], inputs: Any) -> str:
+        func = getattr(build, 'func', build)
+        func = getattr(func, '__func__', func)
+        payload = json.dumps([self.namespace, section, _code_digest(func.__code__), inputs],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _record(self, section: str, outcome: str, lookup: float, seconds: float = 0.0, saved: float = 0.0):
+        stats = self.stats.setdefault(section, {'memory': 0, 'disk': 0, 'miss': 0, 'lookup': 0.0,
+                                                'seconds': 0.0, 'saved': 0.0})
+        stats[outcome] += 1
+        stats['lookup'] += lookup
+        stats['seconds'] += seconds
+        stats['saved'] += saved
+
+    def get(self, section: str, build: Callable[[], str], inputs: Any = ()) -> str:
+        """Return a cached section, building and storing it on a miss
+
+        inputs must capture everything the section reads besides the
+        generator's own code.
+        """
+        start = time.perf_counter()
+        key = self._key(section, build, inputs)
+
+        entry = _memory.get(key)
+        if entry is not None:
+            self._record(section, 'memory', time.perf_counter() - start, saved=entry['seconds'])
+            return entry['content']
+
+        entry = self._read(key)
+        if entry is not None:
+            _memory[key] = entry
+            self._record(section, 'disk', time.perf_counter() - start, saved=entry['seconds'])
+            return entry['content']
+
+        lookup = time.perf_counter() - start
+        content = build()
+        entry = {'content': content, 'seconds': time.perf_counter() - start - lookup}
+        _memory[key] = entry
+        self._write(key, entry)
+        self._record(section, 'miss', lookup, seconds=entry['seconds'])
+        return content
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.json'
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.directory is None:
+            return None
+        try:
+            return json.loads(self._path(key).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable cache entry {key}: {e}')
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f'.{key}.{os.getpid()}.tmp')
+            tmp_path.write_text(json.dumps(entry), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f'Could not write cache entry {key}: {e}')
+            return
+        self.prune()
+
+    def prune(self, max_entries: int = MAX_ENTRIES, max_age: float = MAX_AGE):
+        """Delete entries older than max_age seconds, then the oldest beyond max_entries"""
+        if self.directory is None:
+            return
+        entries = []
+        for path in self.directory.glob('*/*.json'):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort(reverse=True)
+
+        cutoff = time.time() - max_age
+        for index, (mtime, path) in enumerate(entries):
+            if index >= max_entries or mtime < cutoff:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f'Could not remove cache entry {path.name}: {e}')
+
+    def report(self) -> List[str]:
+        """Human-readable hit rates and time saved per section, net of lookup cost"""
+        lines = []
+        totals = {'memory': 0, 'disk': 0, 'miss': 0, 'lookup': 0.0, 'seconds': 0.0, 'saved': 0.0}
+        for section in sorted(self.stats):
+            stats = self.stats[section]
+            for name in totals:
+                totals[name] += stats[name]
+            lookups = stats['memory'] + stats['disk'] + stats['miss']
+            hit_rate = (stats['memory'] + stats['disk']) / lookups
+            lines.append(f'{section}: {hit_rate:.0%} hits ({stats["memory"]} memory, {stats["disk"]} disk, '
+                         f'{stats["miss"]} miss), {(stats["saved"] - stats["lookup"]) * 1000:.2f}ms saved')
+
+        lookups = totals['memory'] + totals['disk'] + totals['miss']
+        if lookups:
+            hit_rate = (totals['memory'] + totals['disk']) / lookups
+            lines.append(f'total: {hit_rate:.0%} of {lookups} sections from cache, '
+                         f'{(totals["saved"] - totals["lookup"]) * 1000:.2f}ms saved, '
+                         f'{totals["seconds"] * 1000:.2f}ms spent rendering, {totals["lookup"] * 1000:.2f}ms on lookups')
+        return lines
@@ -5,13 +5,25 @@ Python CLI commands for methodology automation
 """
 
 import click
+import glob
+import hashlib
+import io
 import os
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 import logging
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from . import __version__
+from .adapters import FastAPIAdapter
+from .analysis import ANALYZER_VERSION, find_artifacts
+from .rendering import compile_template, context_digest, load_template, project_context
+from .state import BuildState, persona_files
 
 logger = logging.getLogger(__name__)
 
@@ -97,13 +109,16 @@ def copy_templates(force: bool):
         'FRS.fastapi.md': 'methodology/templates/FRS.template.md'
     }
     
-    # Create templates from embedded content
-    create_fastapi_templates()
+    # Create templates from embedded content, keeping local edits unless forced
+    created = create_fastapi_templates(force)
     
-    click.echo('📄 Created FastAPI-specific templates')
+    if created:
+        click.echo(f'📄 Created FastAPI-specific templates: {", ".join(created)}')
+    else:
+        click.echo('📄 Kept existing FastAPI-specific templates (use --force to overwrite)')
 
-def create_fastapi_templates():
-    """Create FastAPI-specific templates"""
+def get_fastapi_templates() -> Dict[str, str]:
+    """Get FastAPI-specific CLAUDE, AGENTS and FRS template sources"""
     
     # CLAUDE template for FastAPI
     claude_template = '''---
@@ -122,6 +137,7 @@ technology: FastAPI + Neo4j + MySQL
 ## Architect Crew Methodology™ for {{projectName}}
 
 **Version**: {{claudeVersion}}  
+**Application Version**: {{appVersion}}  
 **Technology Stack**: Python FastAPI + Neo4j + MySQL + FastAPI-MCP  
 **Generated**: {{generationDate}}  
 **Architecture Type**: Hybrid Database API with Graph Analytics
@@ -172,7 +188,7 @@ performance_strategy:
 ```python
 api_design:
   pattern: "RESTful with OpenAPI documentation"
-  versioning: "URL versioning (/api/v1/)"
+  versioning: "URL versioning ({{apiPrefix}}/)"
   authentication: "JWT bearer tokens"
   validation: "Pydantic models with automatic validation"
   error_handling: "Structured error responses"
@@ -360,8 +376,11 @@ technology: FastAPI + Neo4j + MySQL
 # AGENTS.md - FastAPI Implementation Guide
 ## Architect Crew Methodology™ Implementation Instructions
 
+**Project**: {{projectName}}  
 **Version**: {{agentsVersion}}  
 **Technology**: Python FastAPI + Neo4j + MySQL + FastAPI-MCP  
+**Target Environment**: {{environment}}  
+**API Prefix**: {{apiPrefix}}  
 **Generated**: {{generationDate}}  
 **Implementation Type**: Hybrid Database API Development
 
@@ -976,7 +995,9 @@ technology: FastAPI + Neo4j + MySQL
 # FRS.md - FastAPI Technical Specifications
 ## Functional Requirements Specification
 
+**Project**: {{projectName}}  
 **Version**: {{frsVersion}}  
+**Application Version**: {{appVersion}}  
 **Technology**: Python FastAPI + Neo4j + MySQL + FastAPI-MCP  
 **Generated**: {{generationDate}}  
 **Implementation Status**: {{implementationStatus}}
@@ -1744,13 +1765,53 @@ This technical specification provides the complete blueprint for implementing a
 **This specification ensures a production-ready FastAPI application that leverages the full power of hybrid database architecture with modern development practices.**
 '''
     
-    # Write templates to files
+    return {
+        'CLAUDE.template.md': claude_template,
+        'AGENTS.template.md': agents_template,
+        'FRS.template.md': frs_template
+    }
+
+def create_fastapi_templates(force: bool = False) -> List[str]:
+    """Create FastAPI-specific templates, returning the names written
+    
+    Existing templates are project customisations and are only replaced
+    with force.
+    """
     templates_dir = Path('methodology/templates')
     templates_dir.mkdir(parents=True, exist_ok=True)
     
-    (templates_dir / 'CLAUDE.template.md').write_text(claude_template, encoding='utf-8')
-    (templates_dir / 'AGENTS.template.md').write_text(agents_template, encoding='utf-8')
-    (templates_dir / 'FRS.template.md').write_text(frs_template, encoding='utf-8')
+    created = []
+    for name, source in get_fastapi_templates().items():
+        path = templates_dir / name
+        if path.exists() and not force:
+            continue
+        path.write_text(source, encoding='utf-8')
+        created.append(name)
+    return created
+
+def render_project_template(name: str, context: Dict[str, Any],
+                            header: bool = False) -> Tuple[str, Dict[str, str]]:
+    """Render a methodology template with per-project values
+
+    The project's copy in methodology/templates wins so local edits apply;
+    otherwise the embedded FastAPI template is used. With header, only the
+    front matter and title block are rendered. Returns the content and the
+    digests to record as build inputs (the generation date is excluded so
+    a new day alone does not trigger a rebuild).
+    """
+    path = Path('methodology/templates') / name
+    if path.exists():
+        template = load_template(path)
+    else:
+        template = compile_template(get_fastapi_templates()[name])
+    if header:
+        template = template.header()
+    
+    digests = {
+        f'template:{name}': template.digest,
+        'context': context_digest(context, template.placeholders - {'generationDate'})
+    }
+    return template.render(context), digests
 
 def generate_initial_docs(force: bool):
     """Generate initial RDS.md if it doesn't exist"""
@@ -2079,8 +2140,43 @@ def display_next_steps():
     click.echo('7. Start development: uvicorn app.main:app --reload')
     click.echo('8. API docs available at: http://localhost:8000/api/v1/docs')
 
+def generation_versions() -> Dict[str, str]:
+    """Generator versions recorded alongside each stage's input hashes"""
+    return {
+        'methodology': __version__,
+        'adapter': FastAPIAdapter().version
+    }
+
+def run_generation_stage(stage: str, inputs: List[Path], output: Path, content: str,
+                         force: bool, explain: bool, digests: Optional[Dict[str, str]] = None) -> bool:
+    """Write a generated file unless its inputs are unchanged since the last build
+
+    Returns True when the output was (re)written.
+    """
+    state = BuildState()
+    fingerprint = state.fingerprint(inputs, generation_versions(), digests)
+    reasons = ['--force given'] if force else state.explain(stage, fingerprint, output)
+
+    if not reasons:
+        if explain:
+            click.echo(f'⏭️  {stage}: up to date ({len(fingerprint["inputs"])} inputs unchanged)')
+        return False
+
+    if explain:
+        click.echo(f'🔁 {stage}: rebuilding because')
+        for reason in reasons:
+            click.echo(f'   - {reason}')
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(content, encoding='utf-8')
+    state.record(stage, fingerprint, output)
+    state.save()
+    return True
+
 @methodology.command()
-def generate_claude():
+@click.option('--force', is_flag=True, help='Regenerate even if inputs are unchanged')
+@click.option('--explain', is_flag=True, help='Explain why the stage did or did not rebuild')
+def generate_claude(force: bool, explain: bool):
     """Generate CLAUDE.md from RDS.md"""
     click.echo('🏗️ Generating CLAUDE.md from RDS.md...')
     
@@ -2090,21 +2186,19 @@ def generate_claude():
         click.echo('❌ docs/RDS.md not found. Run setup first.', err=True)
         return 1
     
-    # For now, create a basic CLAUDE.md
-    claude_content = '''# CLAUDE.md - FastAPI Architecture Specification
-## Generated from RDS.md
-
-This file will be automatically generated based on your RDS.md requirements.
-
-Please use the full methodology generator once implemented.
-'''
+    claude_content, digests = render_project_template('CLAUDE.template.md', project_context())
     
-    Path('CLAUDE.md').write_text(claude_content, encoding='utf-8')
-    click.echo('✅ CLAUDE.md generated successfully!')
+    inputs = [rds_path] + persona_files()
+    if run_generation_stage('generate_claude', inputs, Path('CLAUDE.md'), claude_content, force, explain, digests):
+        click.echo('✅ CLAUDE.md generated successfully!')
+    else:
+        click.echo('✅ CLAUDE.md is up to date')
     return 0
 
 @methodology.command()
-def generate_agents():
+@click.option('--force', is_flag=True, help='Regenerate even if inputs are unchanged')
+@click.option('--explain', is_flag=True, help='Explain why the stage did or did not rebuild')
+def generate_agents(force: bool, explain: bool):
     """Generate AGENTS.md from CLAUDE.md"""
     click.echo('🤖 Generating AGENTS.md from CLAUDE.md...')
     
@@ -2114,21 +2208,21 @@ def generate_agents():
         click.echo('❌ CLAUDE.md not found. Run generate_claude first.', err=True)
         return 1
     
-    # For now, create a basic AGENTS.md
-    agents_content = '''# AGENTS.md - FastAPI Implementation Guide
-## Generated from CLAUDE.md
-
-This file will be automatically generated based on your CLAUDE.md architecture.
-
-Please use the full methodology generator once implemented.
-'''
+    agents_content, digests = render_project_template('AGENTS.template.md', project_context())
     
-    Path('AGENTS.md').write_text(agents_content, encoding='utf-8')
-    click.echo('✅ AGENTS.md generated successfully!')
+    if run_generation_stage('generate_agents', [claude_path], Path('AGENTS.md'), agents_content, force, explain, digests):
+        click.echo('✅ AGENTS.md generated successfully!')
+    else:
+        click.echo('✅ AGENTS.md is up to date')
     return 0
 
 @methodology.command()
-def generate_frs():
+@click.option('--force', is_flag=True, help='Regenerate even if inputs are unchanged')
+@click.option('--explain', is_flag=True, help='Explain why the stage did or did not rebuild')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=1, show_default=True,
+              help='Worker processes for parsing changed files (0: CPU count)')
+@click.option('--stats', is_flag=True, help='Report implementation analysis cache hits and net time saved')
+def generate_frs(force: bool, explain: bool, jobs: int, stats: bool):
     """Generate FRS.md from implementation analysis"""
     click.echo('📋 Generating FRS.md from implementation analysis...')
     
@@ -2138,17 +2232,31 @@ def generate_frs():
         click.echo('❌ AGENTS.md not found. Run generate_agents first.', err=True)
         return 1
     
-    # For now, create a basic FRS.md
-    frs_content = '''# FRS.md - FastAPI Technical Specifications
-## Generated from Implementation Analysis
-
-This file will be automatically generated based on your implementation.
-
-Please use the full methodology generator once implemented.
-'''
-    
-    Path('docs/FRS.md').write_text(frs_content, encoding='utf-8')
-    click.echo('✅ docs/FRS.md generated successfully!')
+    # Analyse the app/ tree through the adapter's cached AST index
+    adapter = FastAPIAdapter(jobs=jobs or os.cpu_count() or 1)
+    artifacts = find_artifacts()
+    sections = adapter.generate_frs_content(artifacts)
+    # The FRS template supplies the header; the analysed sections form the body
+    context = project_context(implementationStatus='In development' if artifacts else 'Not started')
+    header, digests = render_project_template('FRS.template.md', context, header=True)
+    body = ''.join(sections.values())
+    frs_content = header + body
+    
+    if stats:
+        click.echo('📊 Section cache:')
+        for line in adapter.cache.report():
+            click.echo(f'   {line}')
+    
+    # The section text is an input too, so editing a generator rebuilds the stage
+    digests.update({
+        'app/**/*.py': adapter.index.digest(),
+        'analyzer': str(ANALYZER_VERSION),
+        'sections': hashlib.sha256(body.encode('utf-8')).hexdigest()
+    })
+    if run_generation_stage('generate_frs', [agents_path], Path('docs/FRS.md'), frs_content, force, explain, digests):
+        click.echo('✅ docs/FRS.md generated successfully!')
+    else:
+        click.echo('✅ docs/FRS.md is up to date')
     return 0
 
 @methodology.command()
@@ -2208,5 +2316,109 @@ def validate():
         click.echo('Your FastAPI project is ready for development!')
         return 0
 
+PROJECT_MARKERS = ['docs/RDS.md', 'app/main.py', 'pyproject.toml', 'requirements.txt']
+
+def find_project_roots(patterns: Tuple[str, ...]) -> List[Path]:
+    """Resolve glob patterns to directories that look like FastAPI projects"""
+    roots = set()
+    for pattern in patterns:
+        for match in glob.glob(pattern, recursive=True):
+            path = Path(match)
+            if path.is_dir() and any((path / marker).exists() for marker in PROJECT_MARKERS):
+                roots.add(path.resolve())
+    return sorted(roots)
+
+def run_project(root: str, steps: Tuple[str, ...], force: bool) -> Dict[str, Any]:
+    """Run methodology steps inside one project root (process pool worker)
+
+    Commands resolve their paths relative to the working directory, so each
+    project is handled by changing into its root. Output is captured and
+    returned so per-project logs do not interleave.
+    """
+    step_commands = {
+        'setup': [(setup, {'force': False})],
+        'generate': [
+            (generate_claude, {'force': force, 'explain': False}),
+            (generate_agents, {'force': force, 'explain': False}),
+            (generate_frs, {'force': force, 'explain': False, 'jobs': 1, 'stats': False})
+        ],
+        'validate': [(validate, {})]
+    }
+
+    output = io.StringIO()
+    result = {'root': root, 'exitCode': 0, 'failedStep': None}
+    start = time.perf_counter()
+
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            os.chdir(root)
+            for step in steps:
+                for command, kwargs in step_commands[step]:
+                    exit_code = command.callback(**kwargs) or 0
+                    if exit_code:
+                        result['exitCode'] = exit_code
+                        result['failedStep'] = command.name
+                        break
+                if result['exitCode']:
+                    break
+        except Exception as e:
+            click.echo(f'❌ {e}', err=True)
+            result['exitCode'] = 1
+            result['failedStep'] = result['failedStep'] or 'run'
+
+    result['duration'] = time.perf_counter() - start
+    result['output'] = output.getvalue()
+    return result
+
+@methodology.command(name='run-all')
+@click.argument('patterns', nargs=-1, required=True)
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Number of worker processes (0: CPU count)')
+@click.option('--step', 'steps', multiple=True, type=click.Choice(['setup', 'generate', 'validate']),
+              default=['generate', 'validate'], show_default=True, help='Steps to run in each project, in order')
+@click.option('--force', is_flag=True, help='Regenerate documents even if inputs are unchanged')
+@click.option('--verbose', is_flag=True, help='Show the output of every project, not only failures')
+@click.pass_context
+def run_all(ctx, patterns: Tuple[str, ...], jobs: int, steps: Tuple[str, ...], force: bool, verbose: bool):
+    """Run methodology steps across every project matching PATTERNS"""
+    roots = find_project_roots(patterns)
+    if not roots:
+        click.echo('❌ No project roots matched.', err=True)
+        ctx.exit(1)
+
+    jobs = jobs or os.cpu_count() or 1
+    click.echo(f'🚀 Running {", ".join(steps)} across {len(roots)} project(s) with {jobs} job(s)...')
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(roots))) as executor:
+        futures = {executor.submit(run_project, str(root), steps, force): root for root in roots}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'root': str(futures[future]), 'exitCode': 1, 'failedStep': 'worker',
+                          'duration': 0.0, 'output': f'❌ Worker failed: {e}\n'}
+            results.append(result)
+    elapsed = time.perf_counter() - start
+
+    cwd = Path.cwd()
+    for result in sorted(results, key=lambda r: r['root']):
+        root = Path(result['root'])
+        name = root.relative_to(cwd) if root.is_relative_to(cwd) else root
+        if result['exitCode']:
+            click.echo(f'❌ {name} ({result["duration"]:.2f}s): {result["failedStep"]} failed')
+        else:
+            click.echo(f'✅ {name} ({result["duration"]:.2f}s)')
+        if verbose or result['exitCode']:
+            for line in result['output'].splitlines():
+                click.echo(f'    {line}')
+
+    failed = [r for r in results if r['exitCode']]
+    busy = sum(r['duration'] for r in results)
+    click.echo(f'\n📊 {len(results) - len(failed)}/{len(results)} project(s) succeeded '
+               f'in {elapsed:.2f}s ({busy:.2f}s of work, {busy / elapsed if elapsed else 0:.1f}x parallelism)')
+    ctx.exit(1 if failed else 0)
+
 if __name__ == '__main__':
     methodology()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Template Rendering
+Compiles front-matter + {{placeholder}} templates once and renders them per project
+"""
+
+from typing import Dict, Any, Iterable, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import ast
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER = re.compile(r'{{\s*(\w+)\s*}}')
+FIELD = re.compile(r'^\*\*(\w[\w ]*)\*\*:\s*(.+?)\s*$', re.MULTILINE)
+
+class CompiledTemplate:
+    """A template split into literal text and placeholder slots
+
+    Parsing happens once; render() only joins precomputed literals with
+    context values, so rendering many projects costs a single pass over
+    the slot list each.
+    """
+
+    def __init__(self, source: str, digest: Optional[str] = None):
+        self.source = source
+        self.digest = digest or hashlib.sha256(source.encode('utf-8')).hexdigest()
+        pieces = PLACEHOLDER.split(source)
+        self._literals = pieces[0::2]
+        self._slots = pieces[1::2]
+        self.placeholders = frozenset(self._slots)
+
+    def header(self) -> 'CompiledTemplate':
+        """The front matter and title block, up to the first horizontal rule"""
+        start = _front_matter_end(self.source)
+        end = self.source.find('\n---\n', start)
+        return compile_template(self.source if end == -1 else self.source[:end])
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Substitute placeholders; unknown ones are left in place and logged"""
+        parts = [self._literals[0]]
+        missing = set()
+        for name, literal in zip(self._slots, self._literals[1:]):
+            value = context.get(name)
+            if value is None:
+                missing.add(name)
+                parts.append('{{' + name + '}}')
+            else:
+                parts.append(str(value))
+            parts.append(literal)
+
+        if missing:
+            logger.warning(f'Unresolved placeholders: {", ".join(sorted(missing))}')
+        return ''.join(parts)
+
+def _front_matter_end(source: str) -> int:
+    """Offset just past the closing --- of the front matter, or 0 when there is none"""
+    if not source.startswith('---\n'):
+        return 0
+    end = source.find('\n---\n', 4)
+    return 0 if end == -1 else end + 5
+
+_compiled: Dict[str, CompiledTemplate] = {}
+_loaded: Dict[Path, Tuple[int, int, CompiledTemplate]] = {}
+
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile a template, reusing the compiled form for identical sources"""
+    key = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    template = _compiled.get(key)
+    if template is None:
+        template = _compiled[key] = CompiledTemplate(source, key)
+    return template
+
+def load_template(path: Path) -> CompiledTemplate:
+    """Compile a template file, recompiling only when it changes on disk"""
+    path = path.resolve()
+    stat = path.stat()
+    cached = _loaded.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    template = compile_template(path.read_text(encoding='utf-8'))
+    _loaded[path] = (stat.st_mtime_ns, stat.st_size, template)
+    return template
+
+def _read_rds_fields(path: Path) -> Dict[str, str]:
+    try:
+        header = path.read_text(encoding='utf-8')[:4096]
+    except FileNotFoundError:
+        return {}
+    return {name: value for name, value in FIELD.findall(header)}
+
+def _read_env(path: Path) -> Dict[str, str]:
+    try:
+        lines = path.read_text(encoding='utf-8').splitlines()
+    except FileNotFoundError:
+        return {}
+    values = {}
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            name, _, value = line.partition('=')
+            values[name.strip()] = value.strip().strip('"\'')
+    return values
+
+def _read_settings_defaults(path: Path) -> Dict[str, Any]:
+    """Literal defaults of the Settings class, read without importing the app"""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (FileNotFoundError, SyntaxError):
+        return {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == 'Settings':
+            defaults = {}
+            for statement in node.body:
+                if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name) \
+                        and isinstance(statement.value, ast.Constant):
+                    defaults[statement.target.id] = statement.value.value
+            return defaults
+    return {}
+
+def project_context(root: Path = Path('.'), **overrides: Any) -> Dict[str, Any]:
+    """Per-project placeholder values from docs/RDS.md and the app Settings
+
+    Settings values come from .env first, then the literal defaults in
+    app/core/config.py, matching how pydantic-settings resolves them.
+    """
+    rds = _read_rds_fields(root / 'docs/RDS.md')
+    settings = {**_read_settings_defaults(root / 'app/core/config.py'), **_read_env(root / '.env')}
+    version = rds.get('Version', '1.0.0')
+
+    context = {
+        'projectName': rds.get('Project') or settings.get('APP_NAME') or root.resolve().name,
+        'appVersion': settings.get('APP_VERSION', '1.0.0'),
+        'environment': settings.get('ENVIRONMENT', 'development'),
+        'apiPrefix': settings.get('API_V1_STR', '/api/v1'),
+        'claudeVersion': version,
+        'agentsVersion': version,
+        'frsVersion': version,
+        'generationDate': datetime.now().strftime('%Y-%m-%d')
+    }
+    context.update(overrides)
+    return context
+
+def context_digest(context: Dict[str, Any], names: Iterable[str]) -> str:
+    """Stable hash of the context values a template uses, for use as a build input
+
+    Values the template never renders are left out so changing them does
+    not trigger a rebuild.
+    """
+    payload = '\n'.join(f'{name}={context.get(name)}' for name in sorted(set(names)))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
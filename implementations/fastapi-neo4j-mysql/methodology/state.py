@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build State Manifest
+Tracks content hashes of generation inputs so unchanged stages can be skipped
+"""
+
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+STATE_PATH = Path('.methodology/state.json')
+STATE_FORMAT = 1
+
+def hash_file(path: Path) -> Optional[str]:
+    """Return the SHA-256 digest of a file, or None if it does not exist"""
+    try:
+        with path.open('rb') as handle:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: handle.read(65536), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def persona_files() -> List[Path]:
+    """Persona documents that feed architecture generation"""
+    personas = list(Path('docs').glob('persona-*.md'))
+    personas.extend(Path('docs/personas').glob('*.md'))
+    return sorted(personas)
+
+class BuildState:
+    """Build-graph manifest stored in .methodology/state.json
+
+    Each stage records the hash of every input, the generator versions it
+    was built with and the hash of the output it produced. A stage is up
+    to date when all three still match.
+    """
+
+    def __init__(self, path: Path = STATE_PATH):
+        self.path = path
+        self.stages: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable build state {self.path}: {e}')
+            return {}
+
+        if not isinstance(data, dict) or data.get('format') != STATE_FORMAT:
+            return {}
+        return data.get('stages', {})
+
+    @staticmethod
+    def fingerprint(inputs: List[Path], versions: Dict[str, str],
+                    digests: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Hash the current inputs of a stage
+
+        digests adds inputs whose hash is computed elsewhere, such as the
+        combined digest of a source tree.
+        """
+        hashes = {path.as_posix(): hash_file(path) for path in inputs}
+        hashes.update(digests or {})
+        return {
+            'inputs': hashes,
+            'versions': dict(versions)
+        }
+
+    def explain(self, stage: str, fingerprint: Dict[str, Any], output: Path) -> List[str]:
+        """Return the reasons a stage must rebuild; empty when it is up to date"""
+        previous = self.stages.get(stage)
+        if previous is None:
+            return ['no previous build recorded']
+
+        reasons = []
+        output_hash = hash_file(output)
+        if output_hash is None:
+            reasons.append(f'{output.as_posix()} is missing')
+        elif output_hash != previous.get('output'):
+            reasons.append(f'{output.as_posix()} was modified since the last build')
+
+        old_inputs = previous.get('inputs', {})
+        for name, digest in fingerprint['inputs'].items():
+            if name not in old_inputs:
+                reasons.append(f'{name} is a new input')
+            elif old_inputs[name] != digest:
+                reasons.append(f'{name} changed')
+        for name in sorted(set(old_inputs) - set(fingerprint['inputs'])):
+            reasons.append(f'{name} is no longer an input')
+
+        old_versions = previous.get('versions', {})
+        for name, version in fingerprint['versions'].items():
+            if old_versions.get(name) != version:
+                reasons.append(f'{name} version changed ({old_versions.get(name)} -> {version})')
+
+        return reasons
+
+    def record(self, stage: str, fingerprint: Dict[str, Any], output: Path):
+        """Record a successful build of a stage"""
+        self.stages[stage] = {
+            **fingerprint,
+            'output': hash_file(output),
+            'builtAt': datetime.now().isoformat()
+        }
+
+    def save(self):
+        """Atomically write the manifest"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'format': STATE_FORMAT, 'stages': self.stages}
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, self.path)
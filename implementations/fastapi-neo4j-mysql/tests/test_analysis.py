@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Implementation Index Tests
+Incremental reparsing and worker-count independent FRS output
+"""
+
+from pathlib import Path
+import os
+from click.testing import CliRunner
+
+from methodology import cache
+from methodology.analysis import PARALLEL_THRESHOLD, ImplementationIndex, find_artifacts
+from methodology.commands import methodology
+
+def test_refresh_reparses_only_changed_files(project: Path, write_app):
+    write_app(3)
+    index = ImplementationIndex()
+    summaries = index.refresh(find_artifacts())
+    assert sorted(summaries) == [f'app/api/items{index}.py' for index in range(3)]
+    assert index.stats == {'parsed': 3, 'reused': 0, 'removed': 0}
+
+    edited = Path('app/api/items1.py')
+    edited.write_text(edited.read_text(encoding='utf-8') + '\n@router.post("/")\nasync def create_item():\n    return {}\n',
+                      encoding='utf-8')
+    index = ImplementationIndex()
+    summaries = index.refresh(find_artifacts())
+    assert index.stats == {'parsed': 1, 'reused': 2, 'removed': 0}
+    assert [endpoint['methods'] for endpoint in summaries['app/api/items1.py']['endpoints']] == [['GET'], ['POST']]
+
+def test_refresh_reuses_touched_files_by_hash(project: Path, write_app):
+    write_app(2)
+    ImplementationIndex().refresh(find_artifacts())
+
+    stat = os.stat('app/api/items0.py')
+    os.utime('app/api/items0.py', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    index = ImplementationIndex()
+    index.refresh(find_artifacts())
+    assert index.stats == {'parsed': 0, 'reused': 2, 'removed': 0}
+
+def test_refresh_drops_removed_files(project: Path, write_app):
+    write_app(2)
+    ImplementationIndex().refresh(find_artifacts())
+    digest = ImplementationIndex().digest()
+
+    Path('app/api/items1.py').unlink()
+    index = ImplementationIndex()
+    assert list(index.refresh(find_artifacts())) == ['app/api/items0.py']
+    assert index.stats == {'parsed': 0, 'reused': 1, 'removed': 1}
+    assert index.digest() != digest
+
+def test_frs_is_identical_for_any_worker_count(project: Path, write_app, monkeypatch):
+    write_app(PARALLEL_THRESHOLD + 16)
+    Path('AGENTS.md').write_text('# AGENTS.md\n', encoding='utf-8')
+
+    outputs = []
+    for jobs in ('1', '4'):
+        # Start cold so every file is parsed with this worker count
+        monkeypatch.setattr(cache, '_memory', {})
+        for path in (Path('.methodology/implementation-index.json'), Path('docs/FRS.md')):
+            path.unlink(missing_ok=True)
+        result = CliRunner().invoke(methodology, ['generate-frs', '--force', '--jobs', jobs])
+        assert result.exit_code == 0, result.output
+        outputs.append(Path('docs/FRS.md').read_bytes())
+
+    assert b'items79' in outputs[0]
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Build State Tests
+Skip and rebuild decisions for the generation stages
+"""
+
+from pathlib import Path
+from click.testing import CliRunner
+
+from methodology.commands import methodology
+from methodology.state import BuildState
+
+def run(*args: str) -> str:
+    result = CliRunner().invoke(methodology, list(args))
+    assert result.exit_code == 0, result.output
+    return result.output
+
+def test_explain_without_previous_build(project: Path):
+    state = BuildState()
+    fingerprint = state.fingerprint([Path('docs/RDS.md')], {'methodology': '1'})
+    assert state.explain('generate_claude', fingerprint, Path('CLAUDE.md')) == ['no previous build recorded']
+
+def test_explain_reports_changed_inputs_versions_and_outputs(project: Path):
+    output = Path('CLAUDE.md')
+    output.write_text('generated', encoding='utf-8')
+    state = BuildState()
+    fingerprint = state.fingerprint([Path('docs/RDS.md')], {'methodology': '1'}, {'context': 'a'})
+    state.record('generate_claude', fingerprint, output)
+    state.save()
+
+    state = BuildState()
+    assert state.explain('generate_claude', fingerprint, output) == []
+
+    Path('docs/RDS.md').write_text('edited', encoding='utf-8')
+    output.write_text('hand edit', encoding='utf-8')
+    fingerprint = state.fingerprint([Path('docs/RDS.md')], {'methodology': '2'}, {'template': 'b'})
+    assert state.explain('generate_claude', fingerprint, output) == [
+        'CLAUDE.md was modified since the last build',
+        'docs/RDS.md changed',
+        'template is a new input',
+        'context is no longer an input',
+        'methodology version changed (1 -> 2)'
+    ]
+
+def test_unchanged_run_skips(project: Path):
+    assert 'generated successfully' in run('generate-claude')
+    output = run('generate-claude', '--explain')
+    assert 'generate_claude: up to date' in output
+    assert 'generated successfully' not in output
+
+def test_editing_rds_rebuilds(project: Path):
+    run('generate-claude')
+    rds = Path('docs/RDS.md')
+    rds.write_text(rds.read_text(encoding='utf-8') + '\n## New requirement\n', encoding='utf-8')
+    output = run('generate-claude', '--explain')
+    assert '- docs/RDS.md changed' in output
+    assert 'generated successfully' in output
+
+def test_unused_settings_do_not_rebuild(project: Path):
+    run('generate-claude')
+    Path('.env').write_text('ENVIRONMENT=staging\n', encoding='utf-8')
+    assert 'CLAUDE.md is up to date' in run('generate-claude')
+
+def test_force_rebuilds_unchanged_stage(project: Path):
+    run('generate-claude')
+    assert 'generated successfully' in run('generate-claude', '--force')
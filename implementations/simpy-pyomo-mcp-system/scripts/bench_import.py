@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for simpy_pyomo_mcp.
+
+Runs ``python -X importtime`` in a fresh interpreter and prints the
+cumulative microseconds spent on the imports a statement triggers (by
+default ``import simpy_pyomo_mcp``), so CI can record the number and catch
+regressions in the lazy exports.
+
+Usage:
+    python scripts/bench_import.py
+    python scripts/bench_import.py --statement "from simpy_pyomo_mcp import SimulationEnvironment" --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+PACKAGE = "simpy_pyomo_mcp"
+
+
+def _top_level_imports(statement: str) -> Dict[str, int]:
+    """Cumulative microseconds of each top-level import made while running ``statement``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"{statement!r} failed:\n" + "\n".join(errors))
+
+    # Report lines look like: "import time:   self [us] | cumulative | name",
+    # with nested imports indented under the module that triggered them
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2][1:].startswith(" "):
+            imports[fields[2].strip()] = int(fields[1])
+    return imports
+
+
+def measure(statement: str) -> int:
+    """Cumulative import time of ``statement`` in microseconds for one cold run.
+
+    Lazy exports are imported after the package itself finishes, so every
+    top-level import is counted except those the interpreter makes at startup.
+    """
+    startup = _top_level_imports("pass")
+    imports = _top_level_imports(statement)
+    return sum(micros for name, micros in imports.items() if name not in startup)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statement", default=f"import {PACKAGE}",
+                        help="Python statement to time (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of cold runs; the fastest is reported (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    try:
+        timings = [measure(args.statement) for _ in range(args.repeat)]
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(min(timings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,11 +12,30 @@ __author__ = "Deon Bands"
 __email__ = "deon@example.com"
 __description__ = "Discrete Event Simulation with Optimization and LLM Integration"
 
-from .core.system_manager import SimPyPyomoMCPSystem, SystemConfiguration
-from .simulation.core.environment import SimulationEnvironment, SimulationConfig
-from .optimization.core.models import OptimizationModel, OptimizationResult
-from .integration.bridge import SimulationOptimizationBridge
-from .mcp.server import MCPServer
+# Underscore aliases keep these helpers out of dir() and star-imports
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Any as _Any, List as _List
+
+if _TYPE_CHECKING:
+    from .core.system_manager import SimPyPyomoMCPSystem, SystemConfiguration
+    from .simulation.core.environment import SimulationEnvironment, SimulationConfig
+    from .optimization.core.models import OptimizationModel, OptimizationResult
+    from .integration.bridge import SimulationOptimizationBridge
+    from .mcp.server import MCPServer
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package, e.g. to read __version__, does not pull in SimPy, Pyomo, FastAPI
+# or pandas. Workers only pay for the subsystems they actually touch.
+_LAZY_EXPORTS = {
+    "SimPyPyomoMCPSystem": ".core.system_manager",
+    "SystemConfiguration": ".core.system_manager",
+    "SimulationEnvironment": ".simulation.core.environment",
+    "SimulationConfig": ".simulation.core.environment",
+    "OptimizationModel": ".optimization.core.models",
+    "OptimizationResult": ".optimization.core.models",
+    "SimulationOptimizationBridge": ".integration.bridge",
+    "MCPServer": ".mcp.server",
+}
 
 __all__ = [
     "SimPyPyomoMCPSystem",
@@ -27,4 +46,19 @@ __all__ = [
     "OptimizationResult",
     "SimulationOptimizationBridge",
     "MCPServer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> _Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module_path, __name__), name)
+    # Cache on the package so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    # Resolved exports are cached in globals(), so merge as sets
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))